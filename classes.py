@@ -6,11 +6,10 @@ Defines the following classes:
 physical jet model grid.
 - ModelRun: Handles all interactions with CASA and execution of a full run
 - Pointing (deprecated)
-- PoitingScheme (deprecated)
+- PointingScheme (deprecated)
 
 @author: Simon Purser (simonp2207@gmail.com)
 """
-import sys
 import os
 import time
 import pickle
@@ -29,6 +28,7 @@ from matplotlib.colors import LogNorm
 from RaJePy import cnsts
 from RaJePy import logger
 from RaJePy import _config as cfg
+from RaJePy.maths import astronomy as mastro
 from RaJePy.maths import geometry as mgeom
 from RaJePy.maths import physics as mphys
 from RaJePy.maths import rrls as mrrl
@@ -129,17 +129,13 @@ class JetModel:
         """
         if not os.path.exists(py_file):
             raise FileNotFoundError(py_file + " does not exist")
-        if os.path.dirname(py_file) not in sys.path:
-            sys.path.append(os.path.dirname(py_file))
 
-        jp = __import__(os.path.basename(py_file).rstrip('.py'))
-        err = miscf.check_model_params(jp.params)
+        params = miscf.load_params(py_file)
+        err = miscf.check_model_params(params)
         if err is not None:
             raise err
 
-        sys.path.remove(os.path.dirname(py_file))
-
-        return jp.params
+        return params
 
     def __init__(self, params: Union[dict, str], log: Union[None, logger.Log]=None):
         """
@@ -203,6 +199,7 @@ class JetModel:
         self._idxs = None   # Grid of cell indices
         self._grid = None  # grid of cell-centre positions
         self._rwp = None
+        self._neg_rr = None  # mask of cells with negative r-coordinates
         # self._rr = None  # grid of cell-centre r-coordinates
         # self._ww = None  # grid of cell-centre w-coordinates
         # self._pp = None  # grid of cell-centre phi-coordinates
@@ -243,7 +240,10 @@ class JetModel:
 
         # Create attribute for jet mass loss rate as a function of a time
         self._jml_t = lambda t: self._ss_jml  # JML as function of time function
+        self._jml_t_from_ejections = True  # jml_t built from ejections only
+        self._jml_t_version = 0  # Incremented on each change to jml_t
         self._ejections = {}  # Record of any ejection events
+        self._ejection_arrays = None  # Ejection records as parallel arrays
         for idx, ejn_t0 in enumerate(self.params['ejection']['t_0']):
             self.add_ejection_event(ejn_t0 * con.year,
                                     self._ss_jml *
@@ -374,6 +374,21 @@ class JetModel:
     @jml_t.setter
     def jml_t(self, new_jml_t: Callable[[float], float]):
         self._jml_t = new_jml_t
+        self._jml_t_from_ejections = False
+        self._jml_t_version += 1
+
+    @property
+    def jml_t_from_ejections(self) -> bool:
+        """Whether jml_t is the steady-state jet mass loss rate plus only the
+        Gaussian ejection events recorded in ejections, i.e. whether jml_t can
+        be evaluated from ejection_arrays. False once jml_t has been set"""
+        return self._jml_t_from_ejections
+
+    @property
+    def jml_t_version(self) -> int:
+        """Count of changes to jml_t, through its setter or ejection events
+        being added, for use in invalidating anything derived from jml_t"""
+        return self._jml_t_version
 
     def add_ejection_event(self, t_0, peak_jml, half_life):
         """
@@ -425,6 +440,8 @@ class JetModel:
 
         record = {'t_0': t_0, 'peak_jml': peak_jml, 'half_life': half_life}
         self._ejections[str(len(self._ejections) + 1)] = record
+        self._ejection_arrays = None
+        self._jml_t_version += 1
 
     @property
     def indices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -494,6 +511,17 @@ class JetModel:
         """Grid of cells' centroids' r coordinates in au"""
         return self.grid_rwp[0]
 
+    @property
+    def neg_rr_mask(self) -> np.ndarray:
+        """Boolean mask of cells whose centroids' r coordinates are negative
+        i.e. those cells within the counter-jet"""
+        if self._neg_rr is not None:
+            return self._neg_rr
+
+        self._neg_rr = self.rr < 0
+
+        return self._neg_rr
+
     @property
     def ww(self) -> np.ndarray:
         """Grid of cells' centroids' w coordinates in au"""
@@ -2137,8 +2165,24 @@ class JetModel:
         return self._ejections
 
     @property
-    def jml_t(self):
-        return self._jml_t
+    def ejection_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Ejection events' peak times (s), peak mass loss rates (kg s^-1) and
+        half-lives (s) as parallel float64 arrays, keyed as the records of
+        ejections are ('t_0', 'peak_jml' and 'half_life')
+        """
+        if self._ejection_arrays is not None:
+            return self._ejection_arrays
+
+        records = self._ejections.values()
+        n_ejections = len(records)
+        self._ejection_arrays = {
+            key: np.fromiter((_[key] for _ in records), dtype=np.float64,
+                             count=n_ejections)
+            for key in ('t_0', 'peak_jml', 'half_life')
+        }
+
+        return self._ejection_arrays
 
     @property
     def ss_jml(self):
@@ -2466,17 +2510,13 @@ class Pipeline:
         """
         if not os.path.exists(py_file):
             raise FileNotFoundError(py_file + " does not exist")
-        if os.path.dirname(py_file) not in sys.path:
-            sys.path.append(os.path.dirname(py_file))
 
-        pl = __import__(os.path.basename(py_file)[:-3])
-        err = miscf.check_pline_params(pl.params)
+        params = miscf.load_params(py_file)
+        err = miscf.check_pline_params(params)
 
         if err:
             raise err
 
-        sys.path.remove(os.path.dirname(py_file))
-
         # if not os.path.exists(py_file):
         #     raise FileNotFoundError(py_file + " does not exist")
         # if os.path.dirname(py_file) not in sys.path:
@@ -2487,7 +2527,7 @@ class Pipeline:
         # if err is not None:
         #     raise err
 
-        return pl.params
+        return params
 
     def __init__(self, jetmodel, params, log=None):
         """
@@ -3178,7 +3218,7 @@ class Pipeline:
                                                                         trc[0],
                                                                         trc[1])
 
-                min_imsize_as = max(np.abs([nx * cellx, ny * celly])) * 7200.
+                min_imsize_as = max(abs(nx * cellx), abs(ny * celly)) * 7200.
                 min_imsize_cells = int(np.ceil(min_imsize_as / cell_size))
 
                 if min_imsize_cells < 500:
@@ -3484,7 +3524,8 @@ class Pipeline:
                        bottom=True, top=True, left=True, right=True)
 
         if savefig:
-            plt.savefig(savefig, bbox_inches='tight', dpi=300)
+            pfunc.savefig_async(plt.gcf(), savefig, log=self.log,
+                                bbox_inches='tight', dpi=300)
 
         return ax
 
@@ -3531,21 +3572,24 @@ class Pipeline:
         l_cell = gridspec.GridSpecFromSubplotSpec(1, 2, outer_grid[0, 0],
                                                   width_ratios=[5.667, 1],
                                                   wspace=0.0, hspace=0.0)
-        l_ax = plt.subplot(l_cell[0, 0])
+        with plt.rc_context(pfunc._INWARD_TICKS_RC):
+            l_ax = plt.subplot(l_cell[0, 0])
         l_cax = plt.subplot(l_cell[0, 1])
 
         # Optical depth
         m_cell = gridspec.GridSpecFromSubplotSpec(1, 2, outer_grid[0, 1],
                                                   width_ratios=[5.667, 1],
                                                   wspace=0.0, hspace=0.0)
-        m_ax = plt.subplot(m_cell[0, 0])
+        with plt.rc_context(pfunc._INWARD_TICKS_RC):
+            m_ax = plt.subplot(m_cell[0, 0])
         m_cax = plt.subplot(m_cell[0, 1])
 
         # Emission measure
         r_cell = gridspec.GridSpecFromSubplotSpec(1, 2, outer_grid[0, 2],
                                                   width_ratios=[5.667, 1],
                                                   wspace=0.0, hspace=0.0)
-        r_ax = plt.subplot(r_cell[0, 0])
+        with plt.rc_context(pfunc._INWARD_TICKS_RC):
+            r_ax = plt.subplot(r_cell[0, 0])
         r_cax = plt.subplot(r_cell[0, 1])
 
         bbox = l_ax.get_window_extent()
@@ -3628,18 +3672,16 @@ class Pipeline:
         m_ax.axes.yaxis.set_ticklabels([])
         r_ax.axes.yaxis.set_ticklabels([])
 
+        # Coordinates of the (common) pixel grid, as 1-D vectors rather than a
+        # meshgrid
+        xs = np.linspace(-x_extent / 2., x_extent / 2., np.shape(flux)[1])
+        zs = np.linspace(-z_extent / 2., z_extent / 2., np.shape(flux)[0])
+
+        # Tau = 1 contour lines are generated once, for all axes
+        pfunc._shared_contour(axes, xs, zs, taus, 1., rasterized=True)
+
         for ax in axes:
-            ax.contour(np.linspace(-x_extent / 2., x_extent / 2.,
-                                   np.shape(flux)[1]),
-                       np.linspace(-z_extent / 2., z_extent / 2.,
-                                   np.shape(flux)[0]),
-                       taus, [1.], colors='w')
-            xlims = ax.get_xlim()
-            ax.set_xticks(ax.get_yticks())
-            ax.set_xlim(xlims)
-            ax.tick_params(which='both', direction='in', top=True,
-                           right=True)
-            ax.minorticks_on()
+            pfunc._yticks_to_xticks(ax)
 
         l_cax.text(0.5, 0.5, r'$\left[{\rm mJy \, pixel^{-1}}\right]$',
                    ha='center', va='center', transform=l_cax.transAxes,
@@ -3653,7 +3695,9 @@ class Pipeline:
             cax.minorticks_on()
 
         if savefig:
-            plt.savefig(savefig, bbox_inches='tight', dpi=300)
+            # Radio plots are kept as pipeline products, so favour file size
+            pfunc.savefig_async(plt.gcf(), savefig, optimize=True,
+                                log=self.log, bbox_inches='tight', dpi=300)
 
         return None
 
@@ -3678,26 +3722,40 @@ class Pointing(object):
             raise ValueError("epoch, {}, is unsupported. Must be J2000 or "
                              "B1950".format(epoch))
 
-        self._coord = SkyCoord(ra, dec, unit=(u.hour, u.deg), frame=frame)
+        self._coord = SkyCoord(mastro.sexagesimal_to_deg(ra, hours=True),
+                               mastro.sexagesimal_to_deg(dec),
+                               unit=(u.deg, u.deg), frame=frame)
         self._epoch = epoch
 
+        # Coordinate is immutable, so its strings are formatted on first access
+        # only and stored thereafter
+        self._ra = None
+        self._dec = None
+
     @property
     def time(self):
         return self._time
 
     @property
     def ra(self):
-        h = self.coord.ra.hms.h
-        m = self.coord.ra.hms.m
-        s = self.coord.ra.hms.s
-        return '{:02.0f}h{:02.0f}m{:06.4f}'.format(h, m, s)
+        if self._ra is not None:
+            return self._ra
+
+        self._ra = self._coord.ra.to_string(unit=u.hour, sep='hms',
+                                            precision=4, pad=True)
+
+        return self._ra
 
     @property
     def dec(self):
-        d = self.coord.dec.dms.d
-        m = self.coord.dec.dms.m
-        s = self.coord.dec.dms.s
-        return '{:+03.0f}d{:02.0f}m{:06.3f}'.format(d, m, s)
+        if self._dec is not None:
+            return self._dec
+
+        self._dec = self._coord.dec.to_string(unit=u.deg, sep='dms',
+                                              precision=3, alwayssign=True,
+                                              pad=True)
+
+        return self._dec
 
     @property
     def duration(self):
@@ -3711,14 +3769,93 @@ class Pointing(object):
     def coord(self):
         return self._coord
 
+    @classmethod
+    def _from_scheme(cls, scheme: 'PointingScheme', idx: int) -> 'Pointing':
+        """
+        Pointing instance sharing the (already computed) vectorised coordinate
+        information of a PointingScheme, rather than constructing its own
+        SkyCoord instance
+        """
+        new_pointing = cls.__new__(cls)
+        new_pointing._time = scheme.times[idx]
+        new_pointing._duration = scheme.durations[idx]
+        new_pointing._coord = scheme.coords[idx]
+        new_pointing._epoch = scheme.epoch
+        new_pointing._ra = scheme.ras[idx]
+        new_pointing._dec = scheme.decs[idx]
 
-# class PointingScheme(object):
-#     """
-#     Class to handle the pointing scheme for synthetic observations
-#     """
-#
-#     def __init__(self):
-#         self.pointings = []
+        return new_pointing
+
+
+class PointingScheme(object):
+    """
+    Class to handle the pointing scheme for synthetic observations. All
+    pointings' coordinates are held in a single, vectorised SkyCoord instance
+    so that conversions/transforms are done once for the whole scheme
+    """
+
+    def __init__(self, times, ras, decs, durations, epoch='J2000'):
+        if epoch == 'J2000':
+            frame = 'fk5'
+        elif epoch == 'B1950':
+            frame = 'fk4'
+        else:
+            raise ValueError("epoch, {}, is unsupported. Must be J2000 or "
+                             "B1950".format(epoch))
+
+        if not len(times) == len(ras) == len(decs) == len(durations):
+            raise ValueError("times, ras, decs and durations must all be of "
+                             "the same length")
+
+        self._times = np.asarray(times, dtype=float)
+        self._durations = np.asarray(durations, dtype=float)
+        self._epoch = epoch
+
+        ra_degs = [mastro.sexagesimal_to_deg(_, hours=True) for _ in ras]
+        dec_degs = [mastro.sexagesimal_to_deg(_) for _ in decs]
+        self._coords = SkyCoord(ra_degs, dec_degs, unit=(u.deg, u.deg),
+                                frame=frame)
+
+        # Single, vectorised conversion for all pointings' ra/dec strings
+        self._ras = self._coords.ra.to_string(unit=u.hour, sep='hms',
+                                              precision=4, pad=True).tolist()
+        self._decs = self._coords.dec.to_string(unit=u.deg, sep='dms',
+                                                precision=3, alwayssign=True,
+                                                pad=True).tolist()
+
+    def __len__(self):
+        return len(self._times)
+
+    def __getitem__(self, idx: int) -> Pointing:
+        return Pointing._from_scheme(self, idx)
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._times
+
+    @property
+    def ras(self) -> List[str]:
+        return self._ras
+
+    @property
+    def decs(self) -> List[str]:
+        return self._decs
+
+    @property
+    def durations(self) -> np.ndarray:
+        return self._durations
+
+    @property
+    def epoch(self) -> str:
+        return self._epoch
+
+    @property
+    def coords(self) -> SkyCoord:
+        return self._coords
 
 
 if __name__ == '__main__':
@@ -3727,78 +3864,117 @@ if __name__ == '__main__':
     #  code!
     import matplotlib.cm
     import matplotlib.pylab as plt
+    from matplotlib.ticker import MaxNLocator
+    from matplotlib.transforms import blended_transform_factory
 
     param_dcy = os.sep.join([os.path.dirname(__file__), 'test', 'test_cases'])
     jm = JetModel(os.sep.join([param_dcy, 'test1-model-params.py']))
     pl = Pipeline(jm, os.sep.join([param_dcy, 'test1-pipeline-params.py']))
     ns = jm.fill_factor
-    ns = np.where(jm.rr < 0, 10 * ns, ns)
-    sum_ns_x = np.nansum(ns, axis=0)
-    sum_ns_y = np.nansum(ns, axis=1)
-    sum_ns_z = np.nansum(ns, axis=2)
+    sum_ns_x, sum_ns_y, sum_ns_z = pfunc.projected_sums(ns, jm.neg_rr_mask,
+                                                        10., nthreads=3)
+
+    # Single precision is ample for display and halves what imshow copies
+    sum_ns_x = sum_ns_x.astype(np.float32, copy=False)
+    sum_ns_y = sum_ns_y.astype(np.float32, copy=False)
+    sum_ns_z = sum_ns_z.astype(np.float32, copy=False)
+
+    # Cell coordinates increase monotonically with index along every axis, so
+    # the grid's extents are given by its first and last elements
+    x_min, x_max = jm.xx.flat[0], jm.xx.flat[-1]
+    y_min, y_max = jm.yy.flat[0], jm.yy.flat[-1]
+    z_min, z_max = jm.zz.flat[0], jm.zz.flat[-1]
 
     plt.close('all')
 
     current_cmap = matplotlib.cm.get_cmap()
     current_cmap.set_bad(color='white')
 
-    fig, ax = plt.subplots(1, 3, figsize=(9, 3.), sharex=True, sharey=True)
-
-    # for a in ax:
-    #     a.set_facecolor(current_cmap(0.))
-
-    ax[0].imshow(sum_ns_x.T[::-1], cmap=current_cmap,
-                 extent=(np.nanmin(jm.yy), np.nanmax(jm.yy),
-                         np.nanmin(jm.zz), np.nanmax(jm.zz)))
-
-    ax[1].imshow(sum_ns_y.T[::-1], cmap=current_cmap,
-                 extent=(np.nanmin(jm.xx), np.nanmax(jm.xx),
-                         np.nanmin(jm.zz), np.nanmax(jm.zz)))
-
-    ax[2].imshow(sum_ns_z.T, cmap=current_cmap,
-                 extent=(np.nanmin(jm.xx), np.nanmax(jm.xx),
-                         np.nanmin(jm.yy), np.nanmax(jm.yy)))
-
-    ax[0].set_title("Sum along axis 0 (x)")
-    ax[1].set_title("Sum along axis 1 (y)")
-    ax[2].set_title("Sum along axis 2 (z)")
-
-    ax[0].set_xlabel("y [au]")
-    ax[0].set_ylabel("z [au]")
-
-    ax[1].set_xlabel("x [au]")
-    ax[1].set_ylabel("z [au]")
-
-    ax[2].set_xlabel("x [au]")
-    ax[2].set_ylabel("y [au]")
-
-    ax[0].set_xlim(np.nanmin([jm.grid]), np.nanmax([jm.grid]))
-    ax[0].set_ylim(np.nanmin([jm.grid]), np.nanmax([jm.grid]))
+    # Compose the three projections side by side into a single image so that
+    # only one AxesImage is drawn. Cells are cubic, so all panels share a pixel
+    # scale, and each panel is NaN-padded about its centre to a common height
+    # so that the vertical axis is in physical coordinates for all of them.
+    # Each panel is normalised to its own range first, so that all three are
+    # independently colour-scaled as separately drawn images would be
+    panels = []
+    for panel in (sum_ns_x.T, sum_ns_y.T, sum_ns_z.T):
+        p_min, p_max = np.nanmin(panel), np.nanmax(panel)
+        panels.append((panel - p_min) / ((p_max - p_min) or 1.))
+    nrows = max(np.shape(_)[0] for _ in panels)
+    composite = np.concatenate([np.pad(_, (((nrows - np.shape(_)[0]) // 2,) * 2,
+                                           (0, 0)), constant_values=np.nan)
+                                for _ in panels], axis=1)
+
+    # Widths of, and horizontal offsets to, each panel within the composite
+    widths = [np.shape(_)[1] * jm.csize for _ in panels]
+    offsets = np.cumsum([0.] + widths[:-1])
+    h_mins = (y_min, x_min, x_min)  # physical coordinate of panels' left edges
+
+    # Size the figure to the composite's aspect ratio, with room for labels,
+    # and lay it out so that the per-panel labels stay on the canvas
+    height = 3.
+    fig, ax = plt.subplots(1, 1, constrained_layout=True,
+                           figsize=(height * sum(widths) /
+                                    (nrows * jm.csize) + 1.5, height + 0.5))
+
+    ax.imshow(composite, cmap=current_cmap, origin='lower',
+              extent=(0., sum(widths),
+                      -nrows * jm.csize / 2., nrows * jm.csize / 2.))
+
+    # Each panel is titled with its summed axis and labelled, below its ticks,
+    # with its own horizontal axis. Short titles fit the narrow panels
+    ticks, ticklabels = [], []
+    panel_trans = blended_transform_factory(ax.transData, ax.transAxes)
+    titles = (r"$\Sigma_x$", r"$\Sigma_y$", r"$\Sigma_z$")
+    h_labels = ("y [au]", "x [au]", "x [au]")
+    for offset, width, h_min, title, h_label in zip(offsets, widths, h_mins,
+                                                    titles, h_labels):
+        for tick in MaxNLocator(4).tick_values(h_min, h_min + width):
+            if h_min <= tick <= h_min + width:
+                ticks.append(offset + tick - h_min)
+                ticklabels.append(format(tick, '.0f'))
+        if offset > 0.:
+            ax.axvline(offset, color='k', lw=1)
+        ax.text(offset + width / 2., 1.02, title, ha='center', va='bottom',
+                transform=panel_trans)
+        ax.annotate(h_label, (offset + width / 2., 0.), xycoords=panel_trans,
+                    xytext=(0., -20.), textcoords='offset points',
+                    ha='center', va='top')
+
+    ax.set_xticks(ticks)
+    ax.set_xticklabels(ticklabels)
+
+    # Vertical axis is z for the x- and y-sums (left) and y for the z-sum
+    # (right), all on the same physical scale
+    ax.set_ylabel("z [au]")
+    ax.secondary_yaxis('right').set_ylabel("y [au]")
+
+    ax.set_ylim(min(x_min, y_min, z_min), max(x_max, y_max, z_max))
 
     plt.show()
 
     from astropy.io import fits
 
     if jm._arr_indexing == 'ij':
-        # hdu = fits.PrimaryHDU(np.nansum(ns, axis=1).T)
-        # Following command puts z-axis on RA-axis and x-axis (reversed) on Dec-axis
-        hdu = fits.PrimaryHDU(ns)
-        # Following command puts x-axis (reversed) on RA-axis and z-axis on Dec-axis
-        hdu = fits.PrimaryHDU(ns.T)
-        # Following command puts x-axis on RA-axis and z-axis (reversed) on Dec-axis
-        hdu = fits.PrimaryHDU(ns.T[::-1])
-        # Following command puts x-axis on RA-axis and z-axis on Dec-axis
-        hdu = fits.PrimaryHDU(np.flip(ns, axis=0).T)
-
-        hdu = fits.PrimaryHDU(np.nansum(ns, axis=1).T)
+        # For the full cube:
+        # - fits.PrimaryHDU(ns) puts z-axis on RA-axis and x-axis (reversed) on
+        #   Dec-axis
+        # - fits.PrimaryHDU(ns.T) puts x-axis (reversed) on RA-axis and z-axis
+        #   on Dec-axis
+        # - fits.PrimaryHDU(ns.T[::-1]) puts x-axis on RA-axis and z-axis
+        #   (reversed) on Dec-axis
+        # - fits.PrimaryHDU(np.flip(ns, axis=0).T) puts x-axis on RA-axis and
+        #   z-axis on Dec-axis
+        # Only the projection along the line of sight (y) is written, made
+        # contiguous once here rather than by astropy on write
+        hdu = fits.PrimaryHDU(np.ascontiguousarray(sum_ns_y.T))
     elif jm._arr_indexing == 'xy':
-        hdu = fits.PrimaryHDU(np.nansum(ns, axis=0).T)
-        hdu = fits.PrimaryHDU(ns)
+        # Full cube, with the same scaling of the counter-jet as in the sums
+        hdu = fits.PrimaryHDU(np.where(jm.neg_rr_mask, 10. * ns, ns))
     else:
         raise ValueError(f"Array indexing should be 'ij' or 'xy', not "
                          f"{jm._arr_indexing.__repr__()}")
     hdul = fits.HDUList([hdu])
-    fitsfile = r'C:/Users/simon/Desktop/ns.fits'
-    if os.path.exists(fitsfile):
-        os.remove(fitsfile)
-    hdul.writeto('../Desktop/ns.fits')
+    fitsfile = os.sep.join([cfg.dcys['home'], 'Desktop', 'ns.fits'])
+    hdul.writeto(fitsfile, overwrite=True, output_verify='silentfix',
+                 checksum=False)
@@ -1,9 +1,69 @@
+import re
 import numpy as np
 import astropy.units as u
 from astropy.coordinates import SkyCoord
 from astropy.coordinates.angles import Longitude, Latitude, Angle
 
 
+def _sexagesimal_re(unit: str, minute: str, second: str) -> re.Pattern:
+    """
+    Compiled pattern matching a signed sexagesimal string in colon, space or
+    unit letter separated form, with a fraction only in its last field.
+    Groups are the sign followed by the form's three fields
+    """
+    num, frac = r'(\d+)', r'(\d+(?:\.\d*)?)'
+    forms = (rf'{num}\s*:\s*{num}\s*:\s*{frac}',
+             rf'{num}\s+{num}\s+{frac}',
+             rf'{num}\s*{unit}\s*{num}\s*{minute}\s*{frac}\s*{second}?')
+
+    return re.compile(r'^\s*([+-])?\s*(?:' + '|'.join(forms) + r')\s*$')
+
+
+# Keyed by sexagesimal_to_deg's hours argument. Match e.g. '12:53:11.5',
+# '12 53 11.5' and '12h53m11.5s' (hours), or '-05:20:14.3', '+05 20 14.3',
+# '-05d20m14.3s' and '05d20\'14.3"' (degrees)
+_SEXAGESIMAL_RES = {True: _sexagesimal_re('h', 'm', 's'),
+                    False: _sexagesimal_re('d', "[m']", '[s"]')}
+
+
+def sexagesimal_to_deg(angle, hours=False):
+    """
+    Convert an angle to decimal degrees, parsing simple sexagesimal strings
+    directly rather than through astropy's (comparatively slow) angle parser.
+
+    Parameters
+    ----------
+    angle: str, float
+        Angle as a sexagesimal string (e.g. 'HH:MM:SS.S' or 'DDdMMmSS.Ss'), or
+        as a float in units of hours (hours=True) or degrees (hours=False)
+    hours: bool
+        Whether angle is given in units of hours, e.g. a right ascension
+
+    Returns
+    -------
+    Angle in degrees as a float
+
+    """
+    if isinstance(angle, str):
+        match = _SEXAGESIMAL_RES[bool(hours)].match(angle)
+        if match is not None:
+            sign = match.group(1)
+            a, m, s = (float(_) for _ in match.groups()[1:] if _ is not None)
+
+        # Defer to astropy for any other string format it supports, and for
+        # out of range minutes/seconds, which astropy rejects (ValueError)
+        if match is None or m >= 60. or s >= 60.:
+            return Angle(angle, unit=u.hour if hours else u.deg).deg
+
+        val = a + m / 60. + s / 3600.
+        if sign == '-':
+            val = -val
+    else:
+        val = float(angle)
+
+    return val * 15. if hours else val
+
+
 def elevation(coord, lat, lst):
     """
     Given a celestial coordinate and observatory latitude, calculate the
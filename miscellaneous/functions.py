@@ -1,3 +1,9 @@
+import copy
+import functools
+import hashlib
+import importlib.util
+import os
+import sys
 from collections.abc import Iterable
 from typing import Union
 import numpy as np
@@ -11,6 +17,51 @@ def is_float(x):
     except ValueError:
         return False
 
+@functools.lru_cache(maxsize=32)
+def _exec_params_file(py_file, sha1):
+    # Executes a parameter file and returns its params. Cached against the
+    # file's path and the SHA1 hash of its contents so that edited files are
+    # re-executed. The file's directory is on sys.path during execution so
+    # that it may import its neighbours
+    dcy = os.path.dirname(py_file)
+    add_dcy = dcy not in sys.path
+    if add_dcy:
+        sys.path.append(dcy)
+
+    try:
+        spec = importlib.util.spec_from_file_location('_params_' + sha1,
+                                                      py_file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        if add_dcy:
+            sys.path.remove(dcy)
+
+    return module.params
+
+
+def load_params(py_file):
+    """
+    Load the params dict defined by a .py parameter file. Repeat loads of an
+    unchanged file are served from a cache rather than re-executing the file
+
+    Parameters
+    ----------
+    py_file : `str`
+        Full path to .py parameter file
+
+    Returns
+    -------
+    params : `dict`
+        Deep copy of the file's params dict, which is safe to modify
+    """
+    py_file = os.path.abspath(py_file)
+    with open(py_file, 'rb') as f:
+        sha1 = hashlib.sha1(f.read()).hexdigest()
+
+    return copy.deepcopy(_exec_params_file(py_file, sha1))
+
+
 def casa_imfit_file_to_dict(filename):
     """
     Convert CASA's imfit output file (defined by its 'summary' parameter) to
@@ -236,7 +287,6 @@ def is_iter(x):
     return isinstance(x, Iterable)
 
 if __name__ == '__main__':
-    import os
     imfit_file = os.sep.join([os.path.expanduser('~'), 'Dropbox',
                               'Paper_RadioRT', 'Results', 'FluxLossModel1',
                               'Day0', '10GHz',
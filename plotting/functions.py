@@ -1,18 +1,225 @@
 # -*- coding: utf-8 -*-
-from typing import Union
+import atexit
+import functools
+import io
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Tuple, Union
 import numpy as np
 import scipy.constants as con
 import matplotlib.axes
+import matplotlib.figure
 import matplotlib.pylab as plt
 import matplotlib.gridspec as gridspec
+from matplotlib.artist import Artist
+from matplotlib.collections import LineCollection
 from matplotlib.colors import LogNorm, SymLogNorm
 from matplotlib.ticker import AutoLocator, AutoMinorLocator, FuncFormatter
 from matplotlib.ticker import MultipleLocator, MaxNLocator
-import astropy.units as u
-# from RaJePy import cnsts
+from RaJePy import cnsts
 # from RaJePy import JetModel
-# from RaJePy import _config as cfg
-# from RaJePy.maths import physics as mphys
+from RaJePy import _config as cfg
+from RaJePy.maths import physics as mphys
+
+if TYPE_CHECKING:
+    from RaJePy import logger
+
+# ContourPy's 'serial' algorithm is faster than matplotlib's default, 'mpl2014',
+# but is only selectable for matplotlib >= 3.6
+_CONTOUR_KWARGS = ({'algorithm': 'serial'}
+                   if 'contour.algorithm' in matplotlib.rcParams else {})
+
+# Inward ticks on all sides, with minor ticks, for image panels. Applied via
+# rc_context on axes creation rather than with per-axes tick_params and
+# minorticks_on calls
+_INWARD_TICKS_RC = {'xtick.direction': 'in', 'ytick.direction': 'in',
+                    'xtick.top': True, 'ytick.right': True,
+                    'xtick.minor.visible': True, 'ytick.minor.visible': True}
+
+# Conversion factors from s to yr, and from kg s^-1 to M_sol yr^-1
+_INV_YEAR = 1. / con.year
+_YR_PER_MSOL = con.year / cnsts.MSOL
+
+
+@functools.lru_cache(maxsize=None)
+def _jml_unit_labels():
+    """
+    Bracketed LaTeX unit strings of jml_profile_plot's x (yr) and y
+    (M_sol yr^-1) axes labels. Built, and astropy.units imported, only on
+    first use
+    """
+    import astropy.units as u
+
+    return tuple(r' \left[ ' + unit.to_string('latex').replace('$', '') +
+                 r'\right] $' for unit in (u.year, u.solMass * u.year ** -1))
+
+
+def _shared_contour(axes, x, y, z, level, colors='w', rasterized=False):
+    """
+    Draw the same single contour level on each of several axes, generating
+    its lines only once. The first axes' contour is drawn as normal, with its
+    lines then added to the remaining axes as one LineCollection each.
+
+    Parameters
+    ----------
+    axes
+        List of axes to contour
+    x
+        1-D x coordinates of z's columns
+    y
+        1-D y coordinates of z's rows
+    z
+        2-D array to contour
+    level
+        Contour level
+    colors
+        Colour of the contour lines, 'w' by default
+    rasterized
+        Whether to rasterize the contour lines, so that vector output and
+        redraws don't re-render each line's paths. False by default
+
+    Returns
+    -------
+    List of the drawn artists, the first axes' QuadContourSet followed by the
+    remaining axes' LineCollections
+    """
+    cs = axes[0].contour(x, y, z, [level], colors=colors, **_CONTOUR_KWARGS)
+
+    # Contour sets are themselves artists for matplotlib >= 3.8, but hold a
+    # list of collections otherwise
+    for artist in [cs] if isinstance(cs, Artist) else cs.collections:
+        artist.set_rasterized(rasterized)
+
+    segs = cs.allsegs[0]
+    artists = [cs]
+    for ax in axes[1:]:
+        lc = LineCollection(segs, colors=colors, rasterized=rasterized)
+        artists.append(ax.add_collection(lc))
+
+    return artists
+
+
+def _yticks_to_xticks(ax):
+    """
+    Place an axes' major x-ticks at the positions of its major y-ticks. Only
+    positions within the current x-limits are used, as set_xticks otherwise
+    expands the limits to include every tick, requiring them to be restored
+    """
+    xmin, xmax = sorted(ax.get_xlim())
+    yticks = ax.get_yticks()
+    ax.set_xticks(yticks[(yticks >= xmin) & (yticks <= xmax)])
+
+
+def savefig_kwargs(savefig: Union[bool, str], optimize: bool = False) -> dict:
+    """
+    Keyword arguments for matplotlib's savefig giving faster PNG writes. Use of
+    zlib compression level 3 (rather than 6) makes little difference to the
+    file size of plots. Other formats are unaffected.
+
+    Parameters
+    ----------
+    savefig
+        Full path of the save file
+    optimize
+        Whether to instead optimise PNGs for the smallest file size, at the
+        expense of a slower write. Suited to products which are kept, False by
+        default
+
+    Returns
+    -------
+    dict of keyword arguments
+    """
+    if isinstance(savefig, str) and savefig.lower().endswith('.png'):
+        if optimize:
+            return {'pil_kwargs': {'optimize': True}}
+        return {'pil_kwargs': {'compress_level': 3}}
+    return {}
+
+
+# Background writes started by savefig_async and not yet waited for, as
+# (thread, save file, log, list holding any exception raised by the write)
+_pending_saves = []
+_pending_saves_lock = threading.Lock()
+
+
+def wait_for_saves() -> None:
+    """
+    Wait for all pending savefig_async writes to complete. Failed writes are
+    logged as errors to the log passed to savefig_async, or re-raised if no
+    log was given. Called before each savefig_async write and at exit.
+
+    Returns
+    -------
+    None
+    """
+    with _pending_saves_lock:
+        pending = _pending_saves[:]
+        del _pending_saves[:]
+
+    for thread, savefig, log, errors in pending:
+        thread.join()
+        if errors:
+            if log is None:
+                raise errors[0]
+            log.add_entry("ERROR",
+                          f"Failed to write {savefig}: {errors[0]}")
+
+
+atexit.register(wait_for_saves)
+
+
+def savefig_async(fig: matplotlib.figure.Figure, savefig: str,
+                  optimize: bool = False, log: 'logger.Log' = None,
+                  **kwargs) -> threading.Thread:
+    """
+    Save a figure, with the figure rendered and encoded to an in-memory buffer
+    and only the write to disk done in a background thread. Allows plotting
+    to continue whilst the file is written. The save file is opened before
+    returning, so invalid paths or permissions raise in the caller.
+
+    Parameters
+    ----------
+    fig
+        Figure to save
+    savefig
+        Full path of the save file, whose extension gives the file format
+    optimize
+        Whether to optimise PNGs for file size (see savefig_kwargs), False by
+        default
+    log
+        Log instance to which a failed write is reported (see wait_for_saves),
+        None by default
+    kwargs
+        Keyword arguments passed to fig.savefig
+
+    Returns
+    -------
+    Thread writing the file, which can be joined to wait for its completion
+    """
+    wait_for_saves()
+
+    fmt = os.path.splitext(savefig)[1][1:] or None
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt, **savefig_kwargs(savefig, optimize),
+                **kwargs)
+    f = open(savefig, 'wb')
+    errors = []
+
+    def write():
+        try:
+            with f:
+                f.write(buf.getbuffer())
+        except Exception as err:
+            errors.append(err)
+
+    thread = threading.Thread(target=write)
+    with _pending_saves_lock:
+        _pending_saves.append((thread, savefig, log, errors))
+    thread.start()
+
+    return thread
 
 
 def equalise_axes(ax, fix_x=False, fix_y=False, fix_z=False):
@@ -45,24 +252,25 @@ def equalise_axes(ax, fix_x=False, fix_y=False, fix_z=False):
         ndims = 2
         logz = False
 
-    x_range = np.ptp(ax.get_xlim())
-    y_range = np.ptp(ax.get_ylim())
+    # Current axes' limits, in log-space for logarithmically-scaled axes
+    xl = np.log10(ax.get_xlim()) if logx else ax.get_xlim()
+    yl = np.log10(ax.get_ylim()) if logy else ax.get_ylim()
     if ndims == 3:
-        z_range = np.ptp(ax.get_zlim())
+        zl = np.log10(ax.get_zlim()) if logz else ax.get_zlim()
     else:
-        z_range = None
+        zl = None
 
-    if logx:
-        x_range = np.ptp(np.log10(ax.get_xlim()))
-    if logy:
-        y_range = np.ptp(np.log10(ax.get_ylim()))
-    if ndims == 3 and logz:
-        z_range = np.ptp(np.log10(ax.get_zlim()))
+    x_range = abs(xl[1] - xl[0])
+    y_range = abs(yl[1] - yl[0])
+    if ndims == 3:
+        z_range = abs(zl[1] - zl[0])
+    else:
+        z_range = None
 
     if ndims == 3:
-        r = np.max([x_range, y_range, z_range])
+        r = max(x_range, y_range, z_range)
     else:
-        r = np.max([x_range, y_range])
+        r = max(x_range, y_range)
 
     if fix_x:
         r = x_range
@@ -71,29 +279,26 @@ def equalise_axes(ax, fix_x=False, fix_y=False, fix_z=False):
     elif ndims == 3 and fix_z:
         r = z_range
 
+    xm = (xl[0] + xl[1]) / 2.
     if logx:
-        xlims = (10 ** (np.mean(np.log10(ax.get_xlim())) - r / 2.),
-                 10 ** (np.mean(np.log10(ax.get_xlim())) + r / 2.))
+        xlims = (10 ** (xm - r / 2.), 10 ** (xm + r / 2.))
     else:
-        xlims = (np.mean(ax.get_xlim()) - r / 2.,
-                 np.mean(ax.get_xlim()) + r / 2.)
+        xlims = (xm - r / 2., xm + r / 2.)
     ax.set_xlim(xlims)
 
+    ym = (yl[0] + yl[1]) / 2.
     if logy:
-        ylims = (10 ** (np.mean(np.log10(ax.get_ylim())) - r / 2.),
-                 10 ** (np.mean(np.log10(ax.get_ylim())) + r / 2.))
+        ylims = (10 ** (ym - r / 2.), 10 ** (ym + r / 2.))
     else:
-        ylims = (np.mean(ax.get_ylim()) - r / 2.,
-                 np.mean(ax.get_ylim()) + r / 2.)
+        ylims = (ym - r / 2., ym + r / 2.)
     ax.set_ylim(ylims)
 
     if ndims == 3:
+        zm = (zl[0] + zl[1]) / 2.
         if logz:
-            zlims = (10 ** (np.mean(np.log10(ax.get_zlim())) - r / 2.),
-                     10 ** (np.mean(np.log10(ax.get_zlim())) + r / 2.))
+            zlims = (10 ** (zm - r / 2.), 10 ** (zm + r / 2.))
         else:
-            zlims = (np.mean(ax.get_zlim()) - r / 2.,
-                     np.mean(ax.get_zlim()) + r / 2.)
+            zlims = (zm - r / 2., zm + r / 2.)
         ax.set_zlim(zlims)
 
         return xlims, ylims, zlims
@@ -101,82 +306,236 @@ def equalise_axes(ax, fix_x=False, fix_y=False, fix_z=False):
     return xlims, ylims
 
 
-def make_colorbar(cax, cmax, cmin=0, position='right', orientation='vertical',
-                  numlevels=50, colmap='viridis', norm=None,
-                  maxticks=AutoLocator(), minticks=False, tickformat=None,
-                  hidespines=False):
-    # Custom colorbar using axes so that can set colorbar properties straightforwardly
+def _colorbar_levels(cmin, cmax, numlevels=50, log=False):
+    """
+    Levels, uniformly spaced in linear or log space, of a colourbar drawn with
+    _make_linear_colorbar or _make_log_colorbar
 
-    if isinstance(norm, LogNorm):
-        colbar = np.linspace(np.log10(cmin), np.log10(cmax), numlevels + 1)
-    elif isinstance(norm, SymLogNorm):
-        raise NotImplementedError
+    Parameters
+    ----------
+    cmin
+        Minimum value of the colourbar
+    cmax
+        Maximum value of the colourbar
+    numlevels
+        numlevels intervals, each subdivided into numlevels levels which share
+        their end points, are used. 50 by default
+    log
+        Whether levels are uniformly spaced in log space, False by default
+
+    Returns
+    -------
+    numpy.ndarray of levels
+    """
+    nlevs = numlevels * (numlevels - 1) + 1
+    if log:
+        levs = np.logspace(np.log10(cmin), np.log10(cmax), nlevs)
     else:
-        colbar = np.linspace(cmin, cmax, numlevels + 1)
-
-    levs = []
-    for e, E in enumerate(colbar, 0):
-        if e < len(colbar) - 1:
-            if isinstance(norm, LogNorm):
-                levs = np.concatenate((levs[:-1], np.linspace(10 ** colbar[e],
-                                                              10 ** colbar[e + 1],
-                                                              numlevels)))
-            else:
-                levs = np.concatenate((levs[:-1], np.linspace(colbar[e],
-                                                              colbar[e + 1],
-                                                              numlevels)))
-    yc = [levs, levs]
-    xc = [np.zeros(len(levs)), np.ones(len(levs))]
+        levs = np.linspace(cmin, cmax, nlevs)
 
     if np.ptp(levs) == 0:
-        if isinstance(norm, LogNorm):
-            levs = np.logspace(np.log10(levs[0]) - 1, np.log10(levs[0]),
-                               len(xc[0]))
+        if log:
+            levs = np.logspace(np.log10(levs[0]) - 1, np.log10(levs[0]), nlevs)
         else:
-            levs = np.linspace(levs[0] * 0.1, levs[0], len(xc[0]))
+            levs = np.linspace(levs[0] * 0.1, levs[0], nlevs)
 
+    return levs
+
+
+def _draw_colorbar(cax, levs, colmap, norm, position, orientation):
+    # Rendered as a 1-D gradient image, avoiding any contour/mesh generation.
+    # Image is placed in axes coordinates, over which levs are uniformly
+    # spaced in the colourbar's (linear or log) scale. Returns the colourbar's
+    # value axis
     if orientation == 'vertical':
-        cax.contourf(xc, yc, yc, cmap=colmap, levels=levs, norm=norm)
+        cax.imshow(levs[:, None], extent=(0, 1, 0, 1), origin='lower',
+                   transform=cax.transAxes, cmap=colmap, norm=norm,
+                   aspect='auto')
         cax.yaxis.set_ticks_position(position)
         cax.xaxis.set_ticks([])
-        axis = cax.yaxis
+        return cax.yaxis
     elif orientation == 'horizontal':
-        cax.contourf(yc, xc, yc, cmap=colmap, levels=levs, norm=norm)
+        cax.imshow(levs[None, :], extent=(0, 1, 0, 1), origin='lower',
+                   transform=cax.transAxes, cmap=colmap, norm=norm,
+                   aspect='auto')
         cax.xaxis.set_ticks_position(position)
         cax.yaxis.set_ticks([])
-        axis = cax.xaxis
+        return cax.xaxis
     else:
         raise ValueError("Orientation must be 'vertical' or 'horizontal'")
 
-    if isinstance(norm, LogNorm):
-        if orientation == 'vertical':
-            cax.set_yscale('log')  # , subsy=minticks if isinstance(minticks, list) else [1, 2, 3, 4, 5, 6, 7, 8, 9])
-        elif orientation == 'horizontal':
-            cax.set_xscale('log')  # , subsy=minticks if isinstance(minticks, list) else [1, 2, 3, 4, 5, 6, 7, 8, 9])
+
+def _set_colorbar_limits(cax, levs, orientation):
+    if orientation == 'vertical':
+        cax.set_xlim(0, 1)
+        cax.set_ylim(levs[0], levs[-1])
+    else:
+        cax.set_xlim(levs[0], levs[-1])
+        cax.set_ylim(0, 1)
+
+
+def _make_log_colorbar(cax, levs, colmap, norm, position='right',
+                       orientation='vertical'):
+    # Colourbar for a LogNorm, from levels of _colorbar_levels(..., log=True).
+    # Returns the colourbar's value axis
+    axis = _draw_colorbar(cax, levs, colmap, norm, position, orientation)
+    if orientation == 'vertical':
+        cax.set_yscale('log')  # , subsy=minticks if isinstance(minticks, list) else [1, 2, 3, 4, 5, 6, 7, 8, 9])
+    else:
+        cax.set_xscale('log')  # , subsy=minticks if isinstance(minticks, list) else [1, 2, 3, 4, 5, 6, 7, 8, 9])
+    _set_colorbar_limits(cax, levs, orientation)
+
+    return axis
+
+
+def _make_linear_colorbar(cax, levs, colmap, norm=None, position='right',
+                          orientation='vertical', maxticks=None,
+                          minticks=False):
+    # Colourbar for a linear norm, from levels of _colorbar_levels(...). Returns
+    # the colourbar's value axis
+    axis = _draw_colorbar(cax, levs, colmap, norm, position, orientation)
+
+    if isinstance(maxticks, list):
+        axis.set_ticks(maxticks)
+    elif isinstance(maxticks, (AutoLocator, AutoMinorLocator, MultipleLocator, MaxNLocator)):
+        axis.set_major_locator(maxticks)
+
+    if isinstance(minticks, list):
+        axis.set_ticks(minticks, minor=True)
+    elif isinstance(minticks, (AutoLocator, AutoMinorLocator, MultipleLocator, MaxNLocator)):
+        axis.set_minor_locator(minticks)
+    elif minticks:
+        axis.set_minor_locator(AutoMinorLocator())
+    _set_colorbar_limits(cax, levs, orientation)
+
+    return axis
+
+
+def make_colorbar(cax, cmax, cmin=0, position='right', orientation='vertical',
+                  numlevels=50, colmap='viridis', norm=None,
+                  maxticks=AutoLocator(), minticks=False, tickformat=None,
+                  hidespines=False):
+    # Custom colorbar using axes so that can set colorbar properties straightforwardly
+    if isinstance(norm, SymLogNorm):
+        raise NotImplementedError
+
+    log = isinstance(norm, LogNorm)
+    levs = _colorbar_levels(cmin, cmax, numlevels=numlevels, log=log)
+
+    if log:
+        axis = _make_log_colorbar(cax, levs, colmap, norm, position=position,
+                                  orientation=orientation)
     else:
-        if isinstance(maxticks, list):
-            axis.set_ticks(maxticks)
-        elif isinstance(maxticks, (AutoLocator, AutoMinorLocator, MultipleLocator, MaxNLocator)):
-            axis.set_major_locator(maxticks)
-
-        if isinstance(minticks, list):
-            axis.set_ticks(minticks, minor=True)
-        elif isinstance(minticks, (AutoLocator, AutoMinorLocator, MultipleLocator, MaxNLocator)):
-            axis.set_minor_locator(minticks)
-        elif minticks:
-            axis.set_minor_locator(AutoMinorLocator())
+        axis = _make_linear_colorbar(cax, levs, colmap, norm=norm,
+                                     position=position,
+                                     orientation=orientation,
+                                     maxticks=maxticks, minticks=minticks)
 
     if tickformat:
-        if orientation == 'vertical':
-            cax.yaxis.set_major_formatter(FuncFormatter(tickformat))
-        elif orientation == 'horizontal':
-            cax.xaxis.set_major_formatter(FuncFormatter(tickformat))
+        axis.set_major_formatter(FuncFormatter(tickformat))
 
     if hidespines:
         for spine in ['left', 'bottom', 'top']:
             cax.spines[spine].set_visible(False)
 
 
+def projected_sums(arr: np.ndarray, mask: Union[None, np.ndarray] = None,
+                   factor: float = 1., block_bytes: int = 2 ** 20,
+                   nthreads: int = 1):
+    """
+    Sums of a 3-D array along each of its three axes, computed in a single
+    pass over the array with NaNs treated as zero.
+
+    Parameters
+    ----------
+    arr
+        3-D array to sum
+    mask
+        Boolean array of the same shape as arr, flagging elements to be
+        multiplied by factor before summation. None (default) for no scaling
+    factor
+        Multiplicative factor applied to elements flagged by mask
+    block_bytes
+        Approximate size, in bytes, of the block of slabs processed at once.
+        Should be small enough for a block to remain resident in (L2) cache,
+        1 MiB by default
+    nthreads
+        Number of threads between which the slabs are divided, 1 by default
+
+    Returns
+    -------
+    Tuple of the 2-D sums of arr along axes 0, 1 and 2, respectively
+    """
+    # Slabs are taken along the slowest-varying axis in memory so that the
+    # reductions within each slab run over contiguous elements
+    if arr.flags.f_contiguous and not arr.flags.c_contiguous:
+        sum_z, sum_y, sum_x = projected_sums(arr.T,
+                                             None if mask is None else mask.T,
+                                             factor, block_bytes, nthreads)
+        return sum_x.T, sum_y.T, sum_z.T
+
+    nx, ny, nz = np.shape(arr)
+    sum_y = np.empty((nx, nz), dtype=arr.dtype)
+    sum_z = np.empty((nx, ny), dtype=arr.dtype)
+
+    # Work through the cube one block of 2-D slabs at a time, so that each
+    # element is only read from memory once, contributes to all three sums
+    # whilst still in cache and no cube-sized temporaries are created. NaNs
+    # are zeroed once per block so plain (non-nan) reductions can be used
+    nslabs = int(max(1, min(nx, block_bytes // (ny * nz * arr.itemsize))))
+
+    def sum_slabs(i_start, i_end):
+        """
+        Sum slabs i_start to i_end (exclusive) along axes 1 and 2 into sum_y
+        and sum_z, returning their partial sum along axis 0
+        """
+        block = np.empty((nslabs, ny, nz), dtype=arr.dtype)
+        block_sum_x = np.empty((ny, nz), dtype=arr.dtype)
+        part_sum_x = np.zeros((ny, nz), dtype=arr.dtype)
+
+        for i0 in range(i_start, i_end, nslabs):
+            i1 = min(i0 + nslabs, i_end)
+            blk = block[:i1 - i0]
+            np.copyto(blk, arr[i0:i1])
+            np.nan_to_num(blk, copy=False)
+            if mask is not None:
+                blk[mask[i0:i1]] *= factor
+            np.add.reduce(blk, axis=0, out=block_sum_x)
+            np.add(part_sum_x, block_sum_x, out=part_sum_x)
+            np.add.reduce(blk, axis=1, out=sum_y[i0:i1])
+            np.add.reduce(blk, axis=2, out=sum_z[i0:i1])
+
+        return part_sum_x
+
+    # NumPy releases the GIL within its loops, so threads working on disjoint
+    # ranges of slabs run concurrently
+    nthreads = int(max(1, min(nthreads, nx)))
+    if nthreads == 1:
+        sum_x = sum_slabs(0, nx)
+    else:
+        bounds = np.linspace(0, nx, nthreads + 1).astype(int)
+        with ThreadPoolExecutor(nthreads) as executor:
+            part_sums = list(executor.map(sum_slabs, bounds[:-1], bounds[1:]))
+        sum_x = np.add.reduce(part_sums, axis=0)
+
+    return sum_x, sum_y, sum_z
+
+
+def _slice_indef_integral(z: np.ndarray, c: float, coeff: float,
+                          mod_r_0: float, r_0: float) -> np.ndarray:
+    """
+    Indefinite integral, coeff * ((z + mod_r_0 - r_0) / mod_r_0) ** c / c, of
+    a jet quantity per unit length along z, following a power-law of index
+    c - 1. Evaluated in place so that only the returned array is allocated
+    """
+    result = np.add(z, mod_r_0 - r_0)
+    np.multiply(result, 1. / mod_r_0, out=result)
+    np.power(result, c, out=result)
+    np.multiply(result, coeff / c, out=result)
+
+    return result
+
+
 def plot_mass_volume_slices(jm: 'JetModel', show_plot: bool = False,
                             savefig: Union[bool, str] = False):
     """
@@ -200,75 +559,59 @@ def plot_mass_volume_slices(jm: 'JetModel', show_plot: bool = False,
     None
     """
 
-    def m_slice(_a, _b):
-        """
-        Mass of slice over the interval from a --> b in z,
-        in kg calculated from model parameters
-        """
-        n_0 = jm.params["properties"]["n_0"] * 1e6
-        mod_r_0 = jm.params["geometry"]["mod_r_0"] * con.au
-        r_0 = jm.params["geometry"]["r_0"] * con.au
-        q_n = jm.params["power_laws"]["q_n"]
-        w_0 = jm.params["geometry"]["w_0"] * con.au
-        eps = jm.params["geometry"]["epsilon"]
-        mu = jm.params['properties']['mu'] * mphys.atomic_mass("H")
-
-        def indef_integral(z):
-            """Volume of slice over the interval from a --> b in z,
-            in m^3 calculated from model parameters"""
-            c = 1 + q_n + 2. * eps
-            num_p1 = mu * np.pi * mod_r_0 * n_0 * w_0 ** 2.
-            num_p2 = ((z + mod_r_0 - r_0) / mod_r_0) ** c
-
-            return num_p1 * num_p2 / c
-
-        return indef_integral(_b) - indef_integral(_a)
-
-    def v_slice(_a, _b):
-        """
-        Volume of slice over the interval from a --> b in z, in m^3
-        """
-        mod_r_0 = jm.params["geometry"]["mod_r_0"] * con.au
-        r_0 = jm.params["geometry"]["r_0"] * con.au
-        w_0 = jm.params["geometry"]["w_0"] * con.au
-        eps = jm.params["geometry"]["epsilon"]
-
-        def indef_integral(z):
-            c = 1 + 2. * eps
-            num_p1 = np.pi * mod_r_0 * w_0 ** 2.
-            num_p2 = ((z + mod_r_0 - r_0) / mod_r_0) ** c
-
-            return num_p1 * num_p2 / c
-
-        return indef_integral(_b) - indef_integral(_a)
-
-    a = np.abs(jm.zs + jm.csize / 2) - jm.csize / 2
-    b = np.abs(jm.zs + jm.csize / 2) + jm.csize / 2
-
-    a = np.where(b <= jm.params['geometry']['r_0'], np.NaN, a)
-    b = np.where(b <= jm.params['geometry']['r_0'], np.NaN, b)
-    a = np.where(a <= jm.params['geometry']['r_0'],
-                 jm.params['geometry']['r_0'], a)
+    # Model parameters, in SI units, describing the jet's mass/volume per unit
+    # length along z
+    n_0 = jm.params["properties"]["n_0"] * 1e6
+    mod_r_0 = jm.params["geometry"]["mod_r_0"] * con.au
+    r_0 = jm.params["geometry"]["r_0"] * con.au
+    q_n = jm.params["power_laws"]["q_n"]
+    w_0 = jm.params["geometry"]["w_0"] * con.au
+    eps = jm.params["geometry"]["epsilon"]
+    mu = jm.params['properties']['mu'] * mphys.atomic_mass("H")
+
+    # Power-law indices and coefficients of the slice mass (in kg) and volume
+    # (in m^3) indefinite integrals
+    c_m = 1 + q_n + 2. * eps
+    coeff_m = mu * np.pi * mod_r_0 * n_0 * w_0 ** 2.
+    c_v = 1 + 2. * eps
+    coeff_v = np.pi * mod_r_0 * w_0 ** 2.
+
+    # Slice centres' offsets, and their absolute values, computed once for
+    # both slice bounds and the averaged z-values' signs
+    half_cell = jm.csize / 2
+    z_offs = jm.zs + half_cell
+    abs_z_offs = np.abs(z_offs)
+    a = abs_z_offs - half_cell
+    b = abs_z_offs + half_cell
+
+    # Slices entirely within r_0 are excluded, and those straddling r_0 start
+    # from it
+    r_0_au = jm.params['geometry']['r_0']
+    inside_r_0 = b <= r_0_au
+    a[inside_r_0] = np.NaN
+    b[inside_r_0] = np.NaN
+    np.maximum(a, r_0_au, out=a)
 
     a *= con.au
     b *= con.au
 
-    # Use the above functions to calculate what each slice's mass should be
-    mslices_calc = m_slice(a, b)
-    vslices_calc = v_slice(a, b)
+    # Calculate what each slice's mass and volume should be over the interval
+    # from a --> b in z
+    mslices_calc = _slice_indef_integral(b, c_m, coeff_m, mod_r_0, r_0)
+    mslices_calc -= _slice_indef_integral(a, c_m, coeff_m, mod_r_0, r_0)
+    vslices_calc = _slice_indef_integral(b, c_v, coeff_v, mod_r_0, r_0)
+    vslices_calc -= _slice_indef_integral(a, c_v, coeff_v, mod_r_0, r_0)
 
-    # Calculate cell volumes and slice volumes
-    vcells = jm.fill_factor * (jm.csize * con.au) ** 3.
-    vslices = np.nansum(np.nansum(vcells, axis=1), axis=1)
+    # Scalings from number density (cm^-3) to mass density (kg m^-3) and from
+    # fill factor to cell volume (m^3), applied to the slices' sums rather than
+    # to every cell
+    md_scale = mu * 1e6
+    cell_vol = (jm.csize * con.au) ** 3.
 
-    # Calculate mass density of cells (in kg m^-3)
-    mdcells = jm.number_density * jm.params['properties']['mu'] * mphys.atomic_mass("H") * 1e6
-
-    # Calculate cell masses
-    mcells = mdcells * vcells
-
-    # Sum cell masses to get slice masses
-    mslices = np.nansum(np.nansum(mcells, axis=1), axis=1)
+    # Sum cell volumes/masses over x and y to get z-slice volumes/masses
+    vslices = np.nansum(jm.fill_factor, axis=(0, 1)) * cell_vol
+    mslices = np.nansum(jm.number_density * jm.fill_factor, axis=(0, 1))
+    mslices *= md_scale * cell_vol
 
     vslices_calc /= con.au ** 3.
     mslices_calc /= cnsts.MSOL
@@ -282,8 +625,8 @@ def plot_mass_volume_slices(jm: 'JetModel', show_plot: bool = False,
     mratios = mslices / mslices_calc
 
     # Average z-value for each slice
-    zs = np.mean([a, b], axis=1) / con.au
-    zs *= np.sign(jm.zs + jm.csize / 2)
+    zs = (a + b) * 0.5 / con.au
+    zs *= np.sign(z_offs)
 
     plt.close('all')
 
@@ -359,6 +702,38 @@ def plot_mass_volume_slices(jm: 'JetModel', show_plot: bool = False,
     return None
 
 
+def _bin_by_radius(rr: np.ndarray, edges: np.ndarray, *weights: np.ndarray):
+    """
+    Sum each of the given weights within uniformly spaced, contiguous bins in
+    radius, in a single pass over the cells. Bin indices are calculated
+    directly from the bin width, rather than searched for.
+
+    Parameters
+    ----------
+    rr
+        Radii of the cells
+    edges
+        Uniformly spaced, increasing, edges of the bins
+    weights
+        Arrays, of the same shape as rr, to sum within each bin. NaNs are
+        treated as zero
+
+    Returns
+    -------
+    Tuple of the binned sums of each of the weights, of length len(edges) - 1
+    """
+    nbins = len(edges) - 1
+    idxs = (rr.ravel() - edges[0]) / (edges[1] - edges[0])
+
+    # Cells outside of the outermost bins (or with NaN radii) are assigned to
+    # an overflow bin, which is discarded
+    in_bins = (idxs >= 0) & (idxs < nbins)
+    idxs = np.where(in_bins, idxs, nbins).astype(int)
+
+    return tuple(np.bincount(idxs, weights=np.nan_to_num(w).ravel(),
+                             minlength=nbins + 1)[:-1] for w in weights)
+
+
 def diagnostic_plot(jm: 'JetModel', show_plot: bool = False,
                     savefig: Union[bool, str] = False):
     """
@@ -408,14 +783,12 @@ def diagnostic_plot(jm: 'JetModel', show_plot: bool = False,
     # Following not implemented yet as vws need to be accurately calculated
     else:
         rs = np.arange(jm.csize / 2., np.nanmax(jm.rr), jm.csize)
-        rs = np.append(-rs, rs)
-        masses_slices = []
-        angmom_slices = []
-        for r in rs:
-            mask = ((jm.rr >= (r - jm.csize / 2.)) &
-                    (jm.rr <= (r + jm.csize / 2.)))
-            masses_slices.append(np.nansum(np.where(mask, masses, np.NaN)))
-            angmom_slices.append(np.nansum(np.where(mask, angmoms, np.NaN)))
+        rs = np.append(-rs[::-1], rs)
+
+        # Slices are contiguous bins in r, so bin every cell in one pass
+        edges = np.append(rs - jm.csize / 2., rs[-1] + jm.csize / 2.)
+        masses_slices, angmom_slices = _bin_by_radius(jm.rr, edges,
+                                                      masses, angmoms)
 
     plt.close('all')
 
@@ -450,6 +823,16 @@ def diagnostic_plot(jm: 'JetModel', show_plot: bool = False,
     return None
 
 
+def _nan_limits(plane: np.ndarray, cube: np.ndarray) -> Tuple[float, float]:
+    """
+    NaN-ignoring minimum and maximum of a plotted plane, falling back to those
+    of the full cube when the plane contains no finite values (e.g. a central
+    plane lying between the jet's cells)
+    """
+    src = plane if np.isfinite(plane).any() else cube
+    return np.nanmin(src), np.nanmax(src)
+
+
 def model_plot(jm: 'JetModel', show_plot: bool = False,
                savefig: Union[bool, str] = False):
     """
@@ -520,69 +903,66 @@ def model_plot(jm: 'JetModel', show_plot: bool = False,
     bbox = bbox.transformed(fig.dpi_scale_trans.inverted())
     aspect = bbox.width / bbox.height
 
-    im_nd = tl_ax.imshow(jm.number_density[:, jm.ny // 2, :].T,
-                         norm=LogNorm(vmin=np.nanmin(jm.number_density),
-                                      vmax=np.nanmax(jm.number_density)),
-                         extent=(np.min(jm.grid[0]),
-                                 np.max(jm.grid[0]) + jm.csize * 1.,
-                                 np.min(jm.grid[2]),
-                                 np.max(jm.grid[2]) + jm.csize * 1.),
+    # Only the central plane of the grid is plotted, so restrict arrays to that
+    # plane before any reductions for the colour scales. Planes are transposed
+    # to imshow's (row=z, col=x) display order and copied once, so that the
+    # reductions and imshow share a single contiguous array
+    nd_plane = np.ascontiguousarray(jm.number_density[:, jm.ny // 2, :].T)
+    T_plane = np.ascontiguousarray(jm.temperature[:, jm.ny // 2, :].T)
+    xi_plane = np.ascontiguousarray(jm.ion_fraction[:, jm.ny // 2, :].T)
+    vy_plane = np.ascontiguousarray(jm.vel[1][:, jm.ny // 2, :].T)
+
+    # Plotted extent is common to all panels
+    g0, g2 = jm.grid[0], jm.grid[2]
+    extent = (g0.min(), g0.max() + jm.csize, g2.min(), g2.max() + jm.csize)
+
+    nd_min, nd_max = _nan_limits(nd_plane, jm.number_density)
+    T_max = max([1e4, _nan_limits(T_plane, jm.temperature)[1]])
+    vy_min, vy_max = _nan_limits(vy_plane, jm.vel[1])
+
+    im_nd = tl_ax.imshow(nd_plane,
+                         norm=LogNorm(vmin=nd_min, vmax=nd_max),
+                         extent=extent,
                          cmap='viridis_r', aspect="equal")
-    tl_ax.set_xlim(np.array(tl_ax.get_ylim()) * aspect)
-    make_colorbar(tl_cax, np.nanmax(jm.number_density),
-                  cmin=np.nanmin(jm.number_density),
-                  position='right', orientation='vertical',
-                  numlevels=50, colmap='viridis_r', norm=im_nd.norm)
-
-    im_T = tr_ax.imshow(jm.temperature[:, jm.ny // 2, :].T,
-                        norm=LogNorm(vmin=100.,
-                                     vmax=max([1e4, np.nanmax(
-                                         jm.temperature)])),
-                        extent=(np.min(jm.grid[0]),
-                                np.max(jm.grid[0]) + jm.csize * 1.,
-                                np.min(jm.grid[2]),
-                                np.max(jm.grid[2]) + jm.csize * 1.),
+    # Panels share limits, so scale the x-limits to the aspect ratio once
+    xlim = np.array(tl_ax.get_ylim()) * aspect
+    tl_ax.set_xlim(xlim)
+    _make_log_colorbar(tl_cax, _colorbar_levels(nd_min, nd_max, log=True),
+                       'viridis_r', im_nd.norm)
+
+    im_T = tr_ax.imshow(T_plane,
+                        norm=LogNorm(vmin=100., vmax=T_max),
+                        extent=extent,
                         cmap='plasma', aspect="equal")
-    tr_ax.set_xlim(np.array(tr_ax.get_ylim()) * aspect)
-    make_colorbar(tr_cax, max([1e4, np.nanmax(jm.temperature)]),
-                  cmin=100., position='right',
-                  orientation='vertical', numlevels=50,
-                  colmap='plasma', norm=im_T.norm)
+    tr_ax.set_xlim(xlim)
+    _make_log_colorbar(tr_cax, _colorbar_levels(100., T_max, log=True),
+                       'plasma', im_T.norm)
     tr_cax.set_ylim(100., 1e4)
 
-    im_xi = bl_ax.imshow(jm.ion_fraction[:, jm.ny // 2, :].T * 100.,
+    im_xi = bl_ax.imshow(xi_plane * 100.,
                          vmin=0., vmax=100.0,
-                         extent=(np.min(jm.grid[0]),
-                                 np.max(jm.grid[0]) + jm.csize * 1.,
-                                 np.min(jm.grid[2]),
-                                 np.max(jm.grid[2]) + jm.csize * 1.),
+                         extent=extent,
                          cmap='gnuplot', aspect="equal")
-    bl_ax.set_xlim(np.array(bl_ax.get_ylim()) * aspect)
-    make_colorbar(bl_cax, 100., cmin=0., position='right',
-                  orientation='vertical', numlevels=50,
-                  colmap='gnuplot', norm=im_xi.norm)
+    bl_ax.set_xlim(xlim)
+    _make_linear_colorbar(bl_cax, _colorbar_levels(0., 100.), 'gnuplot',
+                          im_xi.norm)
     bl_cax.set_yticks(np.linspace(0., 100., 6))
 
-    im_vs = br_ax.imshow(jm.vel[1][:, jm.ny // 2, :].T,
-                         vmin=np.nanmin(jm.vel[1]),
-                         vmax=np.nanmax(jm.vel[1]),
-                         extent=(np.min(jm.grid[0]),
-                                 np.max(jm.grid[0]) + jm.csize * 1.,
-                                 np.min(jm.grid[2]),
-                                 np.max(jm.grid[2]) + jm.csize * 1.),
+    im_vs = br_ax.imshow(vy_plane,
+                         vmin=vy_min, vmax=vy_max,
+                         extent=extent,
                          cmap='coolwarm', aspect="equal")
-    br_ax.set_xlim(np.array(br_ax.get_ylim()) * aspect)
-    make_colorbar(br_cax, np.nanmax(jm.vel[1]),
-                  cmin=np.nanmin(jm.vel[1]), position='right',
-                  orientation='vertical', numlevels=50,
-                  colmap='coolwarm', norm=im_vs.norm)
+    br_ax.set_xlim(xlim)
+    _make_linear_colorbar(br_cax, _colorbar_levels(vy_min, vy_max),
+                          'coolwarm', im_vs.norm)
 
     dx = int((np.ptp(br_ax.get_xlim()) / jm.csize) // 2 * 2 // 20)
     dz = jm.nz // 10
-    vzs = jm.vel[2][::dx, jm.ny // 2, ::dz].flatten()
-    xs = jm.grid[0][::dx, jm.ny // 2, ::dz].flatten()[~np.isnan(vzs)]
-    zs = jm.grid[2][::dx, jm.ny // 2, ::dz].flatten()[~np.isnan(vzs)]
-    vzs = vzs[~np.isnan(vzs)]
+    vzs = jm.vel[2][::dx, jm.ny // 2, ::dz].ravel()
+    finite = ~np.isnan(vzs)
+    xs = jm.grid[0][::dx, jm.ny // 2, ::dz].ravel()[finite]
+    zs = jm.grid[2][::dx, jm.ny // 2, ::dz].ravel()[finite]
+    vzs = vzs[finite]
     cs = br_ax.transAxes.transform((0.15, 0.5))
     cs = br_ax.transData.inverted().transform(cs)
 
@@ -630,9 +1010,7 @@ def model_plot(jm: 'JetModel', show_plot: bool = False,
     br_ax.axes.yaxis.set_ticklabels([])
 
     for ax in axes:
-        xlims = ax.get_xlim()
-        ax.set_xticks(ax.get_yticks())
-        ax.set_xlim(xlims)
+        _yticks_to_xticks(ax)
         ax.tick_params(which='both', direction='in', top=True, right=True)
         ax.minorticks_on()
 
@@ -711,78 +1089,76 @@ def rt_plot(jm: 'JetModel', freq: float, percentile: float = 5.,
     l_cell = gridspec.GridSpecFromSubplotSpec(1, 2, outer_grid[0, 0],
                                               width_ratios=[5.667, 1],
                                               wspace=0.0, hspace=0.0)
-    l_ax = plt.subplot(l_cell[0, 0])
+    with plt.rc_context(_INWARD_TICKS_RC):
+        l_ax = plt.subplot(l_cell[0, 0])
     l_cax = plt.subplot(l_cell[0, 1])
 
     # Optical depth
     m_cell = gridspec.GridSpecFromSubplotSpec(1, 2, outer_grid[0, 1],
                                               width_ratios=[5.667, 1],
                                               wspace=0.0, hspace=0.0)
-    m_ax = plt.subplot(m_cell[0, 0])
+    with plt.rc_context(_INWARD_TICKS_RC):
+        m_ax = plt.subplot(m_cell[0, 0])
     m_cax = plt.subplot(m_cell[0, 1])
 
     # Emission measure
     r_cell = gridspec.GridSpecFromSubplotSpec(1, 2, outer_grid[0, 2],
                                               width_ratios=[5.667, 1],
                                               wspace=0.0, hspace=0.0)
-    r_ax = plt.subplot(r_cell[0, 0])
+    with plt.rc_context(_INWARD_TICKS_RC):
+        r_ax = plt.subplot(r_cell[0, 0])
     r_cax = plt.subplot(r_cell[0, 1])
 
     bbox = l_ax.get_window_extent()
     bbox = bbox.transformed(fig.dpi_scale_trans.inverted())
     aspect = bbox.width / bbox.height
 
-    flux = jm.flux_ff(freq) * 1e3
-    taus = jm.optical_depth_ff(freq)
-    taus = np.where(taus > 0, taus, np.NaN)
-    ems = jm.emission_measure()
-    ems = np.where(ems > 0., ems, np.NaN)
+    # Maps are transposed to (row=z, col=x) display order, as in model_plot.
+    # Both the optical depths and emission measures are freshly calculated, so
+    # are safely masked in place
+    flux = np.ascontiguousarray((jm.flux_ff(freq) * 1e3).T)
+    taus = np.ascontiguousarray(jm.optical_depth_ff(freq).T)
+    np.putmask(taus, taus <= 0., np.NaN)
+    ems = np.ascontiguousarray(jm.emission_measure().T)
+    np.putmask(ems, ems <= 0., np.NaN)
 
     csize_as = np.tan(jm.csize * con.au / con.parsec /
                       jm.params['target']['dist'])  # radians
     csize_as /= con.arcsec  # arcseconds
-    x_extent = np.shape(flux)[0] * csize_as
-    z_extent = np.shape(flux)[1] * csize_as
-
-    flux_min = np.nanpercentile(flux, percentile)
-    im_flux = l_ax.imshow(flux.T,
-                          norm=LogNorm(vmin=flux_min,
-                                       vmax=np.nanmax(flux)),
-                          extent=(-x_extent / 2., x_extent / 2.,
-                                  -z_extent / 2., z_extent / 2.),
+    x_extent = np.shape(flux)[1] * csize_as
+    z_extent = np.shape(flux)[0] * csize_as
+    extent = (-x_extent / 2., x_extent / 2., -z_extent / 2., z_extent / 2.)
+
+    # Lower colour limit and maximum from one partitioning of each array
+    flux_min, flux_max = np.nanquantile(flux, [percentile / 100., 1.])
+    im_flux = l_ax.imshow(flux,
+                          norm=LogNorm(vmin=flux_min, vmax=flux_max),
+                          extent=extent,
                           cmap='gnuplot2_r', aspect="equal")
 
-    l_ax.set_xlim(np.array(l_ax.get_ylim()) * aspect)
-    make_colorbar(l_cax, np.nanmax(flux), cmin=flux_min,
-                  position='right', orientation='vertical',
-                  numlevels=50, colmap='gnuplot2_r',
-                  norm=im_flux.norm)
-
-    tau_min = np.nanpercentile(taus, percentile)
-    im_tau = m_ax.imshow(taus.T,
-                         norm=LogNorm(vmin=tau_min,
-                                      vmax=np.nanmax(taus)),
-                         extent=(-x_extent / 2., x_extent / 2.,
-                                 -z_extent / 2., z_extent / 2.),
+    # Panels share limits, so scale the x-limits to the aspect ratio once
+    xlim = np.array(l_ax.get_ylim()) * aspect
+    l_ax.set_xlim(xlim)
+    _make_log_colorbar(l_cax, _colorbar_levels(flux_min, flux_max, log=True),
+                       'gnuplot2_r', im_flux.norm)
+
+    tau_min, tau_max = np.nanquantile(taus, [percentile / 100., 1.])
+    im_tau = m_ax.imshow(taus,
+                         norm=LogNorm(vmin=tau_min, vmax=tau_max),
+                         extent=extent,
                          cmap='Blues', aspect="equal")
-    m_ax.set_xlim(np.array(m_ax.get_ylim()) * aspect)
-    make_colorbar(m_cax, np.nanmax(taus), cmin=tau_min,
-                  position='right', orientation='vertical',
-                  numlevels=50, colmap='Blues',
-                  norm=im_tau.norm)
-
-    em_min = np.nanpercentile(ems, percentile)
-    im_EM = r_ax.imshow(ems.T,
-                        norm=LogNorm(vmin=em_min,
-                                     vmax=np.nanmax(ems)),
-                        extent=(-x_extent / 2., x_extent / 2.,
-                                -z_extent / 2., z_extent / 2.),
+    m_ax.set_xlim(xlim)
+    _make_log_colorbar(m_cax, _colorbar_levels(tau_min, tau_max, log=True),
+                       'Blues', im_tau.norm)
+
+    em_min, em_max = np.nanquantile(ems, [percentile / 100., 1.])
+    im_EM = r_ax.imshow(ems,
+                        norm=LogNorm(vmin=em_min, vmax=em_max),
+                        extent=extent,
                         cmap='cividis', aspect="equal")
-    r_ax.set_xlim(np.array(r_ax.get_ylim()) * aspect)
-    make_colorbar(r_cax, np.nanmax(ems), cmin=em_min,
-                  position='right', orientation='vertical',
-                  numlevels=50, colmap='cividis',
-                  norm=im_EM.norm)
+    r_ax.set_xlim(xlim)
+    _make_log_colorbar(r_cax, _colorbar_levels(em_min, em_max, log=True),
+                       'cividis', im_EM.norm)
 
     axes = [l_ax, m_ax, r_ax]
     caxes = [l_cax, m_cax, r_cax]
@@ -797,18 +1173,21 @@ def rt_plot(jm: 'JetModel', freq: float, percentile: float = 5.,
     m_ax.axes.yaxis.set_ticklabels([])
     r_ax.axes.yaxis.set_ticklabels([])
 
+    # Only contour the optical depths within the (common) plotted window, plus
+    # a 1-cell margin so that lines remain continuous up to the axes' edges
+    xs = np.linspace(extent[0], extent[1], np.shape(flux)[1])
+    zs = np.linspace(extent[2], extent[3], np.shape(flux)[0])
+    xlims, zlims = sorted(l_ax.get_xlim()), sorted(l_ax.get_ylim())
+    i0 = max(np.searchsorted(xs, xlims[0]) - 1, 0)
+    i1 = min(np.searchsorted(xs, xlims[1]) + 1, len(xs))
+    k0 = max(np.searchsorted(zs, zlims[0]) - 1, 0)
+    k1 = min(np.searchsorted(zs, zlims[1]) + 1, len(zs))
+
+    _shared_contour(axes, xs[i0:i1], zs[k0:k1], taus[k0:k1, i0:i1], 1.,
+                    rasterized=True)
+
     for ax in axes:
-        ax.contour(np.linspace(-x_extent / 2., x_extent / 2.,
-                               np.shape(flux)[0]),
-                   np.linspace(-z_extent / 2., z_extent / 2.,
-                               np.shape(flux)[1]),
-                   taus.T, [1.], colors='w')
-        xlims = ax.get_xlim()
-        ax.set_xticks(ax.get_yticks())
-        ax.set_xlim(xlims)
-        ax.tick_params(which='both', direction='in', top=True,
-                       right=True)
-        ax.minorticks_on()
+        _yticks_to_xticks(ax)
 
     l_cax.text(0.5, 0.5, r'$\left[{\rm mJy \, pixel^{-1}}\right]$',
                ha='center', va='center', transform=l_cax.transAxes,
@@ -833,6 +1212,94 @@ def rt_plot(jm: 'JetModel', freq: float, percentile: float = 5.,
     return None
 
 
+def _ejections_jml(times: np.ndarray, ss_jml: float, t_0s: np.ndarray,
+                   peak_jmls: np.ndarray, hls: np.ndarray) -> np.ndarray:
+    """
+    Mass loss rates at the given times of a steady state jet with Gaussian
+    ejection events. All events are summed in one broadcast evaluation, rather
+    than through JetModel.jml_t's chain of one closure per event, to which it
+    is equivalent
+
+    Parameters
+    ----------
+    times
+        1-D array of times (s)
+    ss_jml
+        Steady state mass loss rate (kg s^-1)
+    t_0s
+        Ejection events' peak times (s)
+    peak_jmls
+        Ejection events' peak mass loss rates (kg s^-1)
+    hls
+        Ejection events' half-lives (s)
+
+    Returns
+    -------
+    numpy.ndarray of mass loss rates (kg s^-1)
+    """
+    sigmas = hls / np.sqrt(2. * np.log(2.))
+
+    # Gaussian profile of each event (columns) at each time (rows)
+    profiles = np.subtract.outer(times, t_0s)
+    profiles /= sigmas
+    np.square(profiles, out=profiles)
+    profiles *= -0.5
+    np.exp(profiles, out=profiles)
+
+    return ss_jml + profiles @ (peak_jmls - ss_jml)
+
+
+# Most recently evaluated mass loss rate profile of each JetModel, keyed on the
+# (jml_t, t_max, n) it was evaluated for. Held weakly so as to not keep models
+# (and their grids) alive
+_jml_profiles = weakref.WeakKeyDictionary()
+
+
+def _jml_profile(jm: 'JetModel', t_max: float, n: int = 1000):
+    """
+    Jet mass loss rate of a JetModel at n times uniformly spaced from 0 to
+    t_max, memoised so that repeated plotting of an unchanged profile skips its
+    re-evaluation. Setting the model's jml_t or adding an ejection event
+    changes its jml_t_version and invalidates the memoised profile. Memoised
+    values hold no reference to the model, so plotted models can still be
+    garbage collected. Evaluated from the model's ejection events with
+    _ejections_jml unless the model's jml_t has been set, in which case jml_t
+    is called.
+
+    Parameters
+    ----------
+    jm
+        JetModel instance whose jml_t to evaluate
+    t_max
+        Maximum time (s)
+    n
+        Number of times, 1000 by default
+
+    Returns
+    -------
+    Tuple of read-only arrays of the times (s) and mass loss rates (kg s^-1)
+    """
+    key = (jm.jml_t_version, jm.ss_jml, t_max, n)
+    cached = _jml_profiles.get(jm)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    times = np.linspace(0, t_max, n)
+    if jm.jml_t_from_ejections:
+        ejns = jm.ejection_arrays
+        jmls = _ejections_jml(times, jm.ss_jml, ejns['t_0'],
+                              ejns['peak_jml'], ejns['half_life'])
+    else:
+        jmls = np.array(np.broadcast_to(jm.jml_t(times), times.shape),
+                        dtype=np.float64)
+    times.flags.writeable = False
+    jmls.flags.writeable = False
+    profile = times, jmls
+    _jml_profiles[jm] = (key, profile)
+
+    return profile
+
+
 def jml_profile_plot(jm: 'JetModel', ax: matplotlib.axes.Axes = None,
                      show_plot: bool = False, savefig: bool = False):
     """
@@ -857,35 +1324,30 @@ def jml_profile_plot(jm: 'JetModel', ax: matplotlib.axes.Axes = None,
     None
     """
     # Plot out to 5 half-lives away from last existing burst in profile
-    t_0s = [jm.ejections[_]['t_0'] for _ in jm.ejections]
-    hls = [jm.ejections[_]['half_life'] for _ in jm.ejections]
-    t_max = np.max(np.array(t_0s + 5 * np.array(hls)))
+    ejns = jm.ejection_arrays
+    t_0s, hls = ejns['t_0'], ejns['half_life']
+    t_max = float((t_0s + 5. * hls).max())
 
-    times = np.linspace(0, t_max, 1000)
-    jmls = jm.jml_t(times)
+    times, jmls = _jml_profile(jm, t_max, 1000)
 
     if ax is None:
         fig, ax = plt.subplots(1, 1, figsize=(cfg.plots['dims']['text'],
                                               cfg.plots['dims']['column']))
 
-    ax.plot(times / con.year, jmls * con.year / cnsts.MSOL, ls='-',
+    ax.plot(times * _INV_YEAR, jmls * _YR_PER_MSOL, ls='-',
             color='blue', lw=2, zorder=3, label=r'$\dot{m}_{\rm jet}$')
 
-    ax.axhline(jm.ss_jml * con.year / 1.98847e30, 0, 1, ls=':',
+    ax.axhline(jm.ss_jml * _YR_PER_MSOL, 0, 1, ls=':',
                color='red', lw=2, zorder=2,
                label=r'$\dot{m}_{\rm jet}^{\rm ss}$')
 
-    xunit = u.format.latex.Latex(times).to_string(u.year)
-    yunit = u.format.latex.Latex(jmls).to_string(u.solMass * u.year ** -1)
-
-    xunit = r' \left[ ' + xunit.replace('$', '') + r'\right] $'
-    yunit = r' \left[ ' + yunit.replace('$', '') + r'\right] $'
-
+    xunit, yunit = _jml_unit_labels()
     ax.set_xlabel(r"$ t \," + xunit)
     ax.set_ylabel(r"$ \dot{m}_{\rm jet}\," + yunit)
 
     if savefig:
-        plt.savefig(savefig, bbox_inches='tight', dpi=300)
+        plt.savefig(savefig, bbox_inches='tight', dpi=300,
+                    **savefig_kwargs(savefig))
 
     if show_plot:
         plt.show()
@@ -0,0 +1,80 @@
+import unittest
+import astropy.units as u
+from astropy.coordinates import Angle
+from RaJePy.maths.astronomy import sexagesimal_to_deg
+
+# Strings handled by sexagesimal_to_deg's own parser
+HOURS_STRS = ('04:31:34.07736', '+04:31:34.07736', '-04:31:34.07736',
+              '04h31m34.07736s', '-04h31m34.07736s', '00:00:00', '23:59:59.9',
+              '04 31 34.07736')
+DEGS_STRS = ('18:08:04.9020', '+18:08:04.9020', '-18:08:04.9020',
+             '18d08m04.9020s', '+18d08m04.9020s', '-05d20m14.3s',
+             '-00:30:00', '89:59:59.99', '+05 20 14.3', "05d20'14.3\"")
+# Strings parsed by astropy.coordinates.Angle instead
+FALLBACK_STRS = ('12.5', '-12.5', '12:30', '12h30m', '12:60:00')
+# Strings whose unit letter doesn't match the hours argument, which astropy
+# parses according to the letter
+UNIT_LETTER_STRS = (('12d30m00s', True), ('-12d30m00s', True),
+                    ('04h31m34s', False), ('+04h31m34.5s', False))
+# Strings astropy rejects, with fractional leading/middle fields or mixed
+# separators
+INVALID_STRS = ('1.5:30:00', '1:30.5:00', '1.5d30m00s', '12h30:00',
+                '12:30m00s')
+
+
+class TestSexagesimalToDeg(unittest.TestCase):
+    def test_hours(self):
+        for angle in HOURS_STRS:
+            with self.subTest(angle=angle):
+                self.assertAlmostEqual(sexagesimal_to_deg(angle, hours=True),
+                                       Angle(angle, unit=u.hour).deg,
+                                       places=10)
+
+    def test_degrees(self):
+        for angle in DEGS_STRS:
+            with self.subTest(angle=angle):
+                self.assertAlmostEqual(sexagesimal_to_deg(angle, hours=False),
+                                       Angle(angle, unit=u.deg).deg,
+                                       places=10)
+
+    def test_fallback(self):
+        for angle in FALLBACK_STRS:
+            for hours, unit in ((True, u.hour), (False, u.deg)):
+                with self.subTest(angle=angle, hours=hours):
+                    self.assertAlmostEqual(sexagesimal_to_deg(angle, hours),
+                                           Angle(angle, unit=unit).deg,
+                                           places=10)
+
+    def test_unit_letters(self):
+        for angle, hours in UNIT_LETTER_STRS:
+            with self.subTest(angle=angle, hours=hours):
+                unit = u.hour if hours else u.deg
+                self.assertAlmostEqual(sexagesimal_to_deg(angle, hours),
+                                       Angle(angle, unit=unit).deg,
+                                       places=10)
+        self.assertAlmostEqual(sexagesimal_to_deg('12d30m00s', hours=True),
+                               12.5)
+        self.assertAlmostEqual(sexagesimal_to_deg('04h31m34s', hours=False),
+                               (4. + 31. / 60. + 34. / 3600.) * 15.)
+
+    def test_invalid(self):
+        for angle in INVALID_STRS:
+            for hours in (True, False):
+                with self.subTest(angle=angle, hours=hours):
+                    with self.assertRaises(ValueError):
+                        sexagesimal_to_deg(angle, hours)
+
+    def test_floats(self):
+        self.assertAlmostEqual(sexagesimal_to_deg(4.5, hours=True), 67.5)
+        self.assertAlmostEqual(sexagesimal_to_deg(-18.25), -18.25)
+
+    def test_out_of_range(self):
+        for angle in ('12:75:09', '12:05:99', '-05d75m14.3s', '05d20m61s'):
+            for hours in (True, False):
+                with self.subTest(angle=angle, hours=hours):
+                    with self.assertRaises(ValueError):
+                        sexagesimal_to_deg(angle, hours)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -6,6 +6,7 @@ Use would be with a RaJePy.classes.JetModel class instance e.g.:
 
 jet_model = RaJePy.classes.JetModel('/full/path/to/example-model-params.py')
 """
+import math
 import numpy as np
 import scipy.constants as con
 
@@ -48,25 +49,27 @@ params = {
                    "mu": 1.3,  # Mean atomic weight (m_H)
                    "mlr": 1e-7,  # Msol / yr
                    },
-    "ejection": {"t_0": np.array([1.]),  # Peak times of bursts (yr)
-                 "hl": np.array([0.5]),  # Half-lives of bursts (yr)
-                 "chi": np.array([5.]),  # Burst factors
+    "ejection": {# Peak times of bursts (yr)
+                 "t_0": np.array([1.], dtype=np.float64),
+                 # Half-lives of bursts (yr)
+                 "hl": np.array([0.5], dtype=np.float64),
+                 # Burst factors
+                 "chi": np.array([5.], dtype=np.float64),
                  }
              }
 # ############################################################################ #
 # ####################### DO NOT CHANGE BELOW ################################ #
 # ############################################################################ #
-# 'Modified' Reynolds ejection radius
-params["geometry"]["mod_r_0"] = params['geometry']['epsilon'] * \
-                                params['geometry']['w_0'] / \
-                                np.tan(np.radians(params['geometry']['opang']
-                                                  / 2.))
+# Sub-dicts and scalars bound locally to avoid repeated lookups
+geom = params['geometry']
+pl = params['power_laws']
+eps = geom['epsilon']
+
+# 'Modified' Reynolds ejection radius (scalar maths via math, not numpy)
+geom["mod_r_0"] = (eps * geom['w_0'] /
+                   math.tan(math.radians(geom['opang'] / 2.)))
 
 # Derive power-law indices for number density and optical depths as functions
 # of distance along the jet axis, r
-params["power_laws"]["q_n"] = -params["power_laws"]["q_v"] - \
-                              (2.0 * params["geometry"]["epsilon"])
-params["power_laws"]["q_tau"] = params["geometry"]["epsilon"] + \
-                                2.0 * params["power_laws"]["q_x"] + \
-                                2.0 * params["power_laws"]["q_n"] - \
-                                1.35 * params["power_laws"]["q_T"]
+pl["q_n"] = -pl["q_v"] - (2.0 * eps)
+pl["q_tau"] = eps + 2.0 * pl["q_x"] + 2.0 * pl["q_n"] - 1.35 * pl["q_T"]
@@ -1,6 +1,6 @@
 import os
 import unittest
-from classes import JetModel
+from classes import JetModel, Pointing, PointingScheme
 
 TEST_PARAM_DCY = os.sep.join([os.path.dirname(__file__), 'test_cases'])
 
@@ -22,5 +22,55 @@ class TestJetModel(unittest.TestCase):
                              f"Model param file is {test_case_file}")
 
 
+class TestPointingScheme(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.times = [0., 1800., 3600., 5400.]
+        cls.ras = ['04:31:34.07736', '04h31m36.5s', '23:59:59.99',
+                   '00:00:00.0']
+        cls.decs = ['+18:08:04.9020', '-05d20m14.3s', '-00:30:00',
+                    '89:59:59.9']
+        cls.durations = [60., 120., 60., 30.]
+
+    def _check_against_pointings(self, epoch):
+        scheme = PointingScheme(self.times, self.ras, self.decs,
+                                self.durations, epoch=epoch)
+        pointings = [Pointing(*_, epoch=epoch) for _ in
+                     zip(self.times, self.ras, self.decs, self.durations)]
+
+        self.assertEqual(len(scheme), len(pointings))
+        self.assertEqual(len(list(scheme)), len(pointings))
+        for idx, pointing in enumerate(pointings):
+            with self.subTest(epoch=epoch, idx=idx):
+                from_scheme = scheme[idx]
+                self.assertEqual(from_scheme.ra, pointing.ra)
+                self.assertEqual(from_scheme.dec, pointing.dec)
+                self.assertEqual(scheme.ras[idx], pointing.ra)
+                self.assertEqual(scheme.decs[idx], pointing.dec)
+                self.assertAlmostEqual(from_scheme.coord.ra.deg,
+                                       pointing.coord.ra.deg, places=10)
+                self.assertAlmostEqual(from_scheme.coord.dec.deg,
+                                       pointing.coord.dec.deg, places=10)
+                self.assertEqual(from_scheme.coord.frame.name,
+                                 pointing.coord.frame.name)
+                self.assertEqual(from_scheme.time, pointing.time)
+                self.assertEqual(from_scheme.duration, pointing.duration)
+                self.assertEqual(from_scheme.epoch, pointing.epoch)
+
+    def test_j2000(self):
+        self._check_against_pointings('J2000')
+
+    def test_b1950(self):
+        self._check_against_pointings('B1950')
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            PointingScheme(self.times, self.ras, self.decs, self.durations,
+                           epoch='J1900')
+        with self.assertRaises(ValueError):
+            PointingScheme(self.times[:-1], self.ras, self.decs,
+                           self.durations)
+
+
 if __name__ == '__main__':
     unittest.main()
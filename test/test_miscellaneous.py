@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from RaJePy.miscellaneous.functions import load_params
+
+PARAMS_TEMPLATE = """import numpy as np
+
+params = {{"grid": {{"n_x": {n_x}, "c_size": 0.5}},
+          "ejection": {{"t_0": np.array([0.5, 1.0])}},
+          "names": ["a", "b"]}}
+"""
+
+
+class TestLoadParams(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dcy = tempfile.TemporaryDirectory()
+        self.py_file = os.sep.join([self.tmp_dcy.name, 'test-params.py'])
+        self._write(n_x=50)
+
+    def tearDown(self):
+        self.tmp_dcy.cleanup()
+
+    def _write(self, **kwargs):
+        with open(self.py_file, 'w') as f:
+            f.write(PARAMS_TEMPLATE.format(**kwargs))
+
+    def test_fresh_deep_copy(self):
+        params1 = load_params(self.py_file)
+        params2 = load_params(self.py_file)
+        self.assertEqual(params1['grid'], params2['grid'])
+        self.assertIsNot(params1, params2)
+        self.assertIsNot(params1['grid'], params2['grid'])
+        self.assertIsNot(params1['names'], params2['names'])
+        self.assertIsNot(params1['ejection']['t_0'],
+                         params2['ejection']['t_0'])
+
+        # Modifying a loaded dict must not affect later loads
+        params1['grid']['n_x'] = 0
+        params1['names'].append('c')
+        params1['ejection']['t_0'][0] = -1.
+        params3 = load_params(self.py_file)
+        self.assertEqual(params3['grid']['n_x'], 50)
+        self.assertEqual(params3['names'], ['a', 'b'])
+        self.assertEqual(params3['ejection']['t_0'][0], 0.5)
+
+    def test_edited_file(self):
+        self.assertEqual(load_params(self.py_file)['grid']['n_x'], 50)
+        self._write(n_x=75)
+        self.assertEqual(load_params(self.py_file)['grid']['n_x'], 75)
+        self._write(n_x=50)
+        self.assertEqual(load_params(self.py_file)['grid']['n_x'], 50)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
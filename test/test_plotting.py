@@ -0,0 +1,121 @@
+import os
+import tempfile
+import unittest
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+from RaJePy import logger
+from RaJePy.classes import JetModel
+from RaJePy.plotting import functions as pfunc
+
+TEST_PARAM_DCY = os.sep.join([os.path.dirname(__file__), 'test_cases'])
+
+
+class TestModelPlot(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dcy = tempfile.TemporaryDirectory()
+        cls.jm = JetModel(os.sep.join([TEST_PARAM_DCY,
+                                       'test2-model-params.py']),
+                          log=logger.Log(os.sep.join([cls.tmp_dcy.name,
+                                                      'test2.log']),
+                                         verbose=False))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dcy.cleanup()
+
+    def test_model_plot_empty_central_plane(self):
+        # Central (y) plane of test2's grid contains no jet cells
+        self.assertFalse(np.isfinite(
+            self.jm.number_density[:, self.jm.ny // 2, :]
+        ).any())
+        savefig = os.sep.join([self.tmp_dcy.name, 'model_plot.png'])
+        pfunc.model_plot(self.jm, savefig=savefig)
+        self.assertTrue(os.path.exists(savefig))
+
+    def test_plot_mass_volume_slices(self):
+        savefig = os.sep.join([self.tmp_dcy.name, 'mass_volume_slices.png'])
+        pfunc.plot_mass_volume_slices(self.jm, savefig=savefig)
+        self.assertTrue(os.path.exists(savefig))
+
+
+class TestJmlProfile(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dcy = tempfile.TemporaryDirectory()
+        self.jm = JetModel(os.sep.join([TEST_PARAM_DCY,
+                                        'test2-model-params.py']),
+                           log=logger.Log(os.sep.join([self.tmp_dcy.name,
+                                                       'test2.log']),
+                                          verbose=False))
+        # Ejection profile extends to ~5 half-lives beyond its last burst
+        ejns = self.jm.ejection_arrays
+        self.t_max = float((ejns['t_0'] + 5. * ejns['half_life']).max())
+
+    def tearDown(self):
+        self.tmp_dcy.cleanup()
+
+    def test_matches_jml_t(self):
+        self.assertTrue(self.jm.jml_t_from_ejections)
+        times, jmls = pfunc._jml_profile(self.jm, self.t_max)
+        np.testing.assert_allclose(jmls, self.jm.jml_t(times), rtol=1e-12)
+
+    def test_set_jml_t(self):
+        # Memoised profile must not be returned once jml_t has been set
+        pfunc._jml_profile(self.jm, self.t_max)
+        old_jml_t = self.jm.jml_t
+        self.jm.jml_t = lambda t: 2. * old_jml_t(t)
+        self.assertFalse(self.jm.jml_t_from_ejections)
+        times, jmls = pfunc._jml_profile(self.jm, self.t_max)
+        np.testing.assert_allclose(jmls, self.jm.jml_t(times), rtol=1e-12)
+
+    def test_memoised(self):
+        profile = pfunc._jml_profile(self.jm, self.t_max)
+        self.assertIs(pfunc._jml_profile(self.jm, self.t_max), profile)
+        self.jm.add_ejection_event(self.t_max / 2., self.jm.ss_jml * 3.,
+                                   self.t_max / 10.)
+        times, jmls = pfunc._jml_profile(self.jm, self.t_max)
+        self.assertFalse(np.array_equal(jmls, profile[1]))
+        np.testing.assert_allclose(jmls, self.jm.jml_t(times), rtol=1e-12)
+
+
+class TestProjectedSums(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(2207)
+        cls.arr = rng.random((23, 17, 11))
+        cls.arr[rng.random(cls.arr.shape) < 0.2] = np.nan
+        cls.mask = rng.random(cls.arr.shape) < 0.3
+        cls.factor = 10.
+
+    def _check(self, arr, mask, **kwargs):
+        expected = arr
+        if mask is not None:
+            expected = np.where(mask, self.factor * arr, arr)
+        sums = pfunc.projected_sums(arr, mask, self.factor, **kwargs)
+        self.assertEqual(len(sums), 3)
+        for axis, result in enumerate(sums):
+            np.testing.assert_allclose(result,
+                                       np.nansum(expected, axis=axis),
+                                       rtol=1e-12, atol=1e-12,
+                                       err_msg=f"axis {axis}, {kwargs}")
+
+    def test_projected_sums(self):
+        for order in ('C', 'F'):
+            arr = np.asarray(self.arr, order=order)
+            for mask in (None, np.asarray(self.mask, order=order)):
+                for kwargs in ({}, {'nthreads': 3}, {'block_bytes': 1},
+                               {'block_bytes': 4000, 'nthreads': 4},
+                               {'nthreads': 100}):
+                    with self.subTest(order=order, mask=mask is not None,
+                                      **kwargs):
+                        self._check(arr, mask, **kwargs)
+
+    def test_input_unmodified(self):
+        arr = self.arr.copy()
+        pfunc.projected_sums(arr, self.mask, self.factor, nthreads=2)
+        np.testing.assert_array_equal(arr, self.arr)
+
+
+if __name__ == '__main__':
+    unittest.main()